@@ -1,12 +1,163 @@
 import os
+import re
+import time
 import base64
+import threading
 import requests
-from fnmatch import fnmatch
+from itertools import islice
+from collections import OrderedDict, deque
+from urllib.parse import urlparse, parse_qs, quote
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from fnmatch import translate
+from typing import List, Optional, TypedDict
 from datetime import datetime, timezone, timedelta
 
+try:
+    # orjson is an optional, faster drop-in for decoding the API responses.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # msgspec is optional, it decodes the responses with a known schema into only the fields we read.
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class GitHubUserRecord(TypedDict):
+    login: str
+
+
+class _IssueRecordFields(TypedDict):
+    number: int
+    title: str
+    state: str
+    created_at: str
+    body: Optional[str]
+    user: GitHubUserRecord
+
+
+class IssueRecord(_IssueRecordFields, total=False):
+    pull_request: dict  # Only set on the pull requests listed by the issues endpoint
+
+
+class CommitAuthorRecord(TypedDict):
+    name: str
+    date: str
+
+
+class CommitDetailRecord(TypedDict):
+    author: CommitAuthorRecord
+    message: str
+
+
+class CommitRecord(TypedDict):
+    sha: str
+    commit: CommitDetailRecord
+    author: Optional[GitHubUserRecord]
+
+
+class TreeEntryRecord(TypedDict, total=False):
+    path: str
+    type: str
+    size: int
+
+
+class TreeRecord(TypedDict):
+    truncated: bool
+    tree: List[TreeEntryRecord]
+
+
+def _decode(content, response_type=None):
+    """
+    Decode a JSON response body.
+    :param content: The raw response body.
+    :param response_type: The expected schema of the response, only the fields it declares are
+    decoded when msgspec is installed (optional).
+    :return: The decoded response
+    """
+    if msgspec is not None and response_type is not None:
+        try:
+            return msgspec.json.decode(content, type=response_type)
+        except msgspec.ValidationError:
+            pass  # The payload does not match the schema, decode it as is
+    return json_loads(content)
+
+
+USER_ACTIVITY_QUERY = """
+query($owner: String!, $name: String!, $authorId: ID!, $since: GitTimestamp!, $until: GitTimestamp!,
+      $prQuery: String!, $issueQuery: String!) {
+  repository(owner: $owner, name: $name) {
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: 100, since: $since, until: $until, author: {id: $authorId}) {
+            pageInfo { hasNextPage }
+            nodes { oid message }
+          }
+        }
+      }
+    }
+  }
+  pullRequests: search(query: $prQuery, type: ISSUE, first: 100) {
+    pageInfo { hasNextPage }
+    nodes {
+      ... on PullRequest {
+        number title body state
+        commits(first: 100) {
+          totalCount
+          nodes { commit { message } }
+        }
+      }
+    }
+  }
+  issues: search(query: $issueQuery, type: ISSUE, first: 100) {
+    pageInfo { hasNextPage }
+    nodes {
+      ... on Issue { number title body }
+    }
+  }
+}
+"""
+
+
+class GitHubItem:
+    """
+    A lightweight record of an issue or a pull request.
+    """
+    __slots__ = ("number", "title", "state", "created_at", "author", "body")
+
+    def __init__(self, item):
+        """
+        :param item: The issue or pull request object returned by the GitHub API.
+        """
+        self.number = item['number']
+        self.title = item['title']
+        self.state = item['state']
+        self.created_at = item['created_at']
+        self.author = item['user']['login']
+        self.body = item['body']
+
+    def as_dict(self):
+        """
+        Convert the record to a dictionary, e.g. for JSON serialization.
+        :return: Dictionary of the record fields
+        """
+        return {field: getattr(self, field) for field in self.__slots__}
+
 
 class GitHubIntegration:
     BASE_URL = "https://api.github.com"
+    GRAPHQL_URL = "https://api.github.com/graphql"
+    MAX_WORKERS = 8
+    ETAG_CACHE_SIZE = 1024
+    RATE_LIMIT_THRESHOLD = 10
+    RATE_LIMIT_RETRIES = 3
+    RATE_LIMIT_NOTICE_DELAY = 5  # Waits longer than this many seconds are reported
+    MAX_FILE_SIZE = 100 * 1024 * 1024  # Largest file served by the raw media type of the contents API
 
     def __init__(self, github_repo: str, github_token=None):
         """
@@ -22,19 +173,217 @@ class GitHubIntegration:
             "Accept": "application/vnd.github.v3+json"
         }
 
-    def _make_request(self, endpoint=None, params=None):
+        # Share one pooled session so consecutive API calls reuse the same keep-alive connection.
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        self._user_ids = {}
+
+        # LRU cache of (etag, raw body, links) keyed by request, used for conditional GETs. The raw
+        # body is kept instead of the decoded one, so that callers never share a mutable object.
+        self._etag_cache = OrderedDict()
+        self._etag_lock = threading.Lock()
+
+        # Timestamps before which no request is sent, per rate limit resource, shared by the worker threads.
+        self._resume_at = {}
+        self._rate_limit_lock = threading.Lock()
+
+    def _send(self, method, url, **kwargs):
+        """
+        Send a request, waiting for the rate limit window when it is (nearly) exhausted.
+        Rate-limited responses are retried after the delay given by `Retry-After` or `X-RateLimit-Reset`.
+        Each rate limit resource (core, search, graphql, ...) is tracked separately.
+        :param method: The HTTP method.
+        :param url: The URL to request.
+        :param kwargs: Extra arguments passed to `requests.Session.request`.
+        :return: The response
+        """
+        if url == self.GRAPHQL_URL:
+            resource = "graphql"
+        elif url.startswith(f"{self.BASE_URL}/search/"):
+            resource = "search"
+        else:
+            resource = "core"
+
+        for _ in range(self.RATE_LIMIT_RETRIES + 1):
+            with self._rate_limit_lock:
+                delay = self._resume_at.get(resource, 0.0) - time.time()
+            if delay > 0:
+                if delay > self.RATE_LIMIT_NOTICE_DELAY:
+                    print(f"GitHub {resource} rate limit reached, waiting {int(delay)} seconds before the next request")
+                time.sleep(delay)
+
+            response = self._session.request(method, url, timeout=(5, 30), **kwargs)
+            remaining = response.headers.get("X-RateLimit-Remaining")
+            reset = response.headers.get("X-RateLimit-Reset")
+            retry_after = response.headers.get("Retry-After")
+            resource = response.headers.get("X-RateLimit-Resource", resource)
+            rate_limited = response.status_code == 429 or \
+                (response.status_code == 403 and (remaining == "0" or retry_after is not None))
+
+            resume_at = None
+            if rate_limited and retry_after is not None:
+                resume_at = time.time() + float(retry_after)
+            elif remaining is not None and reset is not None and int(remaining) < self.RATE_LIMIT_THRESHOLD:
+                resume_at = float(reset)
+            elif rate_limited:
+                # Secondary rate limits without a hint ask to wait at least one minute.
+                resume_at = time.time() + 60
+            if resume_at is not None:
+                with self._rate_limit_lock:
+                    self._resume_at[resource] = max(self._resume_at.get(resource, 0.0), resume_at)
+
+            if not rate_limited:
+                break
+        return response
+
+    def _request(self, endpoint=None, params=None, response_type=None):
+        """
+        Make a GET request to the GitHub API. Responses are revalidated with their ETag, so
+        unchanged resources come back as 304 Not Modified, which is not counted against the rate limit,
+        and are decoded from the cached body.
+        :param endpoint: The endpoint to request.
+        :param params: The parameters to include in the request.
+        :param response_type: The expected schema of the response (optional).
+        :return: A tuple of the JSON response and the parsed pagination links.
+        """
+        url = f"{self.BASE_URL}/repos/{self.github_repo}" + (f"/{endpoint}" if endpoint else "")
+        key = (url, tuple(sorted((params or {}).items())))
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self._send("GET", url, params=params, headers=headers)
+        if cached and response.status_code == 304:
+            with self._etag_lock:
+                if key in self._etag_cache:
+                    self._etag_cache.move_to_end(key)
+            return _decode(cached[1], response_type), cached[2]
+
+        response.raise_for_status()
+        data = _decode(response.content, response_type)
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[key] = (etag, response.content, response.links)
+                self._etag_cache.move_to_end(key)
+                if len(self._etag_cache) > self.ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        return data, response.links
+
+    def _make_request(self, endpoint=None, params=None, response_type=None):
         """
         Make a GET request to the GitHub API.
         :param endpoint: The endpoint to request.
         :param params: The parameters to include in the request.
+        :param response_type: The expected schema of the response (optional).
         :return: The JSON response from the request.
         """
-        url = f"{self.BASE_URL}/repos/{self.github_repo}" + (f"/{endpoint}" if endpoint else "")
-        response = requests.get(url, headers=self.headers, params=params)
+        return self._request(endpoint, params, response_type)[0]
+
+    def _graphql(self, query, variables):
+        """
+        Make a query to the GitHub GraphQL API.
+        :param query: The GraphQL query.
+        :param variables: The variables of the query.
+        :return: The `data` field of the JSON response.
+        """
+        response = self._send("POST", self.GRAPHQL_URL, json={"query": query, "variables": variables})
         response.raise_for_status()
-        return response.json()
+        payload = json_loads(response.content)
+        if payload.get("errors"):
+            raise RuntimeError("; ".join(error.get("message", "") for error in payload["errors"]))
+        return payload["data"]
+
+    def _iter_pages(self, endpoint, params=None, response_type=None, limit=None):
+        """
+        Iterate over the pages of a paginated endpoint, in page order, as advertised by the
+        Link header. Once the first page reveals the last page number, the next pages are
+        fetched concurrently, at most one pool width ahead of the consumer.
+        :param endpoint: The endpoint to request.
+        :param params: The parameters to include in the request.
+        :param response_type: The expected schema of each page (optional).
+        :param limit: Maximum number of items the caller needs, no page past it is requested (optional).
+        :return: A generator of the non-empty pages
+        """
+        params = dict(params or {})
+        params["page"] = 1
+        max_page = -(-limit // params.get("per_page", 30)) if limit else None
+        page_items, links = self._request(endpoint, params, response_type)
+        if not page_items:
+            return
+        yield page_items
+
+        last = links.get("last")
+        if last:
+            last_page = int(parse_qs(urlparse(last["url"]).query)["page"][0])
+            if max_page:
+                last_page = min(last_page, max_page)
+            pages = iter(range(2, last_page + 1))
+            executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+            try:
+                futures = deque(
+                    executor.submit(self._make_request, endpoint, {**params, "page": page}, response_type)
+                    for page in islice(pages, self.MAX_WORKERS)
+                )
+                while futures:
+                    page_items = futures.popleft().result()
+                    if not page_items:
+                        return
+                    yield page_items
+                    # Only request a further page once the caller has asked for more.
+                    page = next(pages, None)
+                    if page is not None:
+                        futures.append(
+                            executor.submit(self._make_request, endpoint, {**params, "page": page}, response_type)
+                        )
+            finally:
+                # Drop the pages not yet requested if the caller stops early.
+                executor.shutdown(wait=False, cancel_futures=True)
+            return
+
+        # Without a last page, follow the next links until the API stops advertising one.
+        while "next" in links and not (max_page and params["page"] >= max_page):
+            params["page"] += 1
+            page_items, links = self._request(endpoint, params, response_type)
+            if not page_items:
+                break
+            yield page_items
 
-    def _process_items(self, endpoint, start_date=None, end_date=None, username=None, limit=None):
+    @staticmethod
+    def _parse_date_range(start_date=None, end_date=None, start_dt=None, end_dt=None):
+        """
+        Parse the boundaries of an inclusive date range.
+        :param start_date: Start date of the range, in 'YYYY-MM-DD' format
+        :param end_date: End date of the range, in 'YYYY-MM-DD' format
+        :param start_dt: Already parsed start of the range, returned as is (optional)
+        :param end_dt: Already parsed end of the range, returned as is (optional)
+        :return: A tuple of the UTC start of the first day and end of the last day, None if not provided
+        """
+        if start_dt is None and start_date:
+            start_dt = datetime.strptime(start_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        if end_dt is None and end_date:
+            end_dt = datetime.strptime(end_date, "%Y-%m-%d").replace(hour=23, minute=59, second=59, tzinfo=timezone.utc)
+        return start_dt, end_dt
+
+    @staticmethod
+    def _parse_timestamp(timestamp):
+        """
+        Parse a GitHub API timestamp, e.g. '2024-01-01T00:00:00Z'.
+        :param timestamp: The ISO 8601 timestamp
+        :return: The timezone-aware datetime
+        """
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+
+    def _process_items(self, endpoint, start_date=None, end_date=None, username=None, limit=None,
+                       start_dt=None, end_dt=None):
         """
         Helper method to process issues or pull requests.
         :param endpoint: The endpoint to process (e.g., 'issues' or 'pulls')
@@ -42,8 +391,14 @@ class GitHubIntegration:
         :param end_date: End date for issue/PR range (inclusive), in 'YYYY-MM-DD' format
         :param username: GitHub username to filter issues/PRs (optional)
         :param limit: Maximum number of issues/PRs to retrieve (default is None, which retrieves all in range)
-        :return: Dictionary of issues and pull requests
+        :param start_dt: Pre-parsed start of the range, used instead of parsing `start_date` (optional)
+        :param end_dt: Pre-parsed end of the range, used instead of parsing `end_date` (optional)
+        :return: Dictionary of GitHubItem records of the issues or pull requests, keyed by number
         """
+        # The issues endpoint also lists pull requests, which are reported by the pulls endpoint instead.
+        skip_pull_requests = endpoint == "issues"
+        start_dt, end_dt = self._parse_date_range(start_date, end_date, start_dt, end_dt)
+
         params = {
             "state": "all",
             "per_page": 100,  # GitHub API max per page
@@ -52,41 +407,29 @@ class GitHubIntegration:
         }
         if username:
             params["creator"] = username
-        if start_date:
-            params["since"] = f"{start_date}T00:00:00Z"
+        if start_dt:
+            params["since"] = start_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
 
         items = {}
-        page = 1
-        while True:
-            params["page"] = page
-            page_items = self._make_request(endpoint, params=params)
-            if not page_items:
-                break
-
+        for page_items in self._iter_pages(endpoint, params, List[IssueRecord]):
             for item in page_items:
-                created_at = datetime.strptime(item['created_at'], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+                created_at = self._parse_timestamp(item['created_at'])
 
-                if end_date and created_at > datetime.strptime(end_date, "%Y-%m-%d").replace(hour=23, minute=59,
-                                                                                             second=59,
-                                                                                             tzinfo=timezone.utc):
+                if end_dt and created_at > end_dt:
                     continue
-                if start_date and created_at < datetime.strptime(start_date, "%Y-%m-%d").replace(tzinfo=timezone.utc):
+                if start_dt and created_at < start_dt:
                     return items  # Stop if we've passed the start date
+                if skip_pull_requests and 'pull_request' in item:
+                    continue
+                # The pulls endpoint does not support the creator parameter
+                if username and item['user']['login'] != username:
+                    continue
 
-                items[item['number']] = {
-                    "number": item['number'],
-                    "title": item['title'],
-                    "state": item['state'],
-                    "created_at": item['created_at'],
-                    "author": item['user']['login'],
-                    "body": item['body']
-                }
+                items[item['number']] = GitHubItem(item)
 
                 if limit and len(items) >= limit:
                     return items
 
-            page += 1
-
         return items
 
     def get_readme(self):
@@ -95,6 +438,8 @@ class GitHubIntegration:
         :return: The readme content
         """
         content = self.get_source_code("README.md")
+        if "README.md" in content:
+            return content["README.md"]
         if len(content):
             return list(content.values())[0]
         return None
@@ -124,91 +469,126 @@ class GitHubIntegration:
             for contributor in self._make_request("contributors")
         ]
 
-    def get_source_code(self, file_pattern="*"):
+    def _read_file(self, item):
         """
-        Process source code files in the repository.
+        Read the content of a file in the repository. The raw media type returns the file
+        bytes directly, the base64 content of the contents API is only used as a fallback.
+        :param item: The file entry from the contents or Git Trees API.
+        :return: The file content, or a message explaining why it could not be read
+        """
+        size = item.get('size')
+        if size is not None and size > self.MAX_FILE_SIZE:
+            return f"File too large to process directly. Size: {size} bytes"
+
+        try:
+            response = self._send(
+                "GET",
+                f"{self.BASE_URL}/repos/{self.github_repo}/contents/{quote(item['path'])}",
+                headers={"Accept": "application/vnd.github.raw"}
+            )
+            if response.status_code == 200:
+                return response.text
+            if 'content' in item and item.get('encoding') == 'base64':
+                return base64.b64decode(item['content']).decode('utf-8')
+            if item.get('download_url'):
+                response = self._send("GET", item['download_url'])
+            # Without a fallback, surface the error of the request to the except branch below.
+            response.raise_for_status()
+            return response.text
+        except Exception as e:
+            error_message = f"Error: {str(e)}"
+            if isinstance(e, requests.exceptions.RequestException) and e.response is not None:
+                error_message += f" (Status code: {e.response.status_code})"
+            print(f"Error processing file {item['path']}: {error_message}")
+            return f"Unable to process content: {error_message}"
+
+    def iter_source_code(self, file_pattern="*"):
+        """
+        Stream source code files in the repository, in the order their contents arrive.
         :param file_pattern: Wildcard pattern to filter files (e.g., "*.py" for Python files)
-        :return: Dictionary with file paths as keys and file contents as values
+        :return: A generator of (file path, file content) tuples
         """
+        # Compile the pattern once, the "*" default matches every file and needs no check.
+        match = None if file_pattern == "*" else re.compile(translate(file_pattern)).match
 
-        def get_contents(path=""):
+        def walk_contents(path=""):
             contents = self._make_request(f"contents/{path}")
             if isinstance(contents, list):
                 for item in contents:
                     if item['type'] == 'dir':
-                        yield from get_contents(item['path'])
-                    elif fnmatch(item['name'], file_pattern):
+                        yield from walk_contents(item['path'])
+                    elif match is None or match(item['name']):
                         yield item
-            elif fnmatch(contents['name'], file_pattern):
+            elif match is None or match(contents['name']):
                 yield contents
 
-        source_code = {}
-        for item in get_contents():
-            try:
-                if 'content' in item and item.get('encoding') == 'base64':
-                    content = base64.b64decode(item['content']).decode('utf-8')
-                elif 'download_url' in item:
-                    response = requests.get(item['download_url'], headers=self.headers)
-                    response.raise_for_status()
-                    content = response.text
-                else:
-                    content = f"File too large to process directly. Size: {item.get('size', 'unknown')} bytes"
-                source_code[item['path']] = content
-            except Exception as e:
-                error_message = f"Error: {str(e)}"
-                if isinstance(e, requests.exceptions.RequestException):
-                    error_message += f" (Status code: {e.response.status_code})"
-                print(f"Error processing file {item['path']}: {error_message}")
-                source_code[item['path']] = f"Unable to process content: {error_message}"
-        return source_code
-
-    def get_commit_history(self, start_date=None, end_date=None, username=None, limit=None):
+        def get_contents():
+            default_branch = self._make_request()["default_branch"]
+            tree = self._make_request(f"git/trees/{default_branch}", params={"recursive": 1}, response_type=TreeRecord)
+            if tree.get("truncated"):
+                # The tree is too large for a single response, list it directory by directory instead.
+                yield from walk_contents()
+                return
+            for entry in tree["tree"]:
+                if entry["type"] == "blob" and (match is None or match(entry["path"].rsplit("/", 1)[-1])):
+                    yield entry
+
+        # Keep a bounded number of files in flight, so that only those are held in memory.
+        executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+        try:
+            pending = {}
+            for item in get_contents():
+                pending[executor.submit(self._read_file, item)] = item['path']
+                if len(pending) >= 2 * self.MAX_WORKERS:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield pending.pop(future), future.result()
+            for future in as_completed(pending):
+                yield pending[future], future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_source_code(self, file_pattern="*"):
+        """
+        Process source code files in the repository.
+        :param file_pattern: Wildcard pattern to filter files (e.g., "*.py" for Python files)
+        :return: Dictionary with file paths as keys and file contents as values
+        """
+        return dict(self.iter_source_code(file_pattern))
+
+    def get_commit_history(self, start_date=None, end_date=None, username=None, limit=None, start_dt=None, end_dt=None):
         """
         Process commit history within a specified date range and for a specific user.
         :param start_date: Start date for commit range (inclusive), in 'YYYY-MM-DD' format
         :param end_date: End date for commit range (inclusive), in 'YYYY-MM-DD' format
         :param username: GitHub username to filter commits (optional)
         :param limit: Maximum number of commits to retrieve (default is None, which retrieves all commits in range)
+        :param start_dt: Pre-parsed start of the range, used instead of parsing `start_date` (optional)
+        :param end_dt: Pre-parsed end of the range, used instead of parsing `end_date` (optional)
         :return: Dictionary of commits
         """
+        start_dt, end_dt = self._parse_date_range(start_date, end_date, start_dt, end_dt)
+
         params = {"per_page": 100}  # GitHub API max per page
-        if start_date:
-            params["since"] = f"{start_date}T00:00:00Z"
-        if end_date:
-            params["until"] = f"{end_date}T23:59:59Z"
+        if start_dt:
+            params["since"] = start_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+        if end_dt:
+            params["until"] = end_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
         if username:
             params["author"] = username
 
-        commits = []
-        page = 1
-        while True:
-            params["page"] = page
-            page_commits = self._make_request("commits", params=params)
-            if not page_commits:
-                break
-            commits.extend(page_commits)
-            if limit and len(commits) >= limit:
-                commits = commits[:limit]
-                break
-            page += 1
-
+        # The range and author are filtered by the API, so the pages are consumed as they arrive.
         commit_history = {}
-        for commit in commits:
-            commit_date = datetime.strptime(commit['commit']['author']['date'], "%Y-%m-%dT%H:%M:%SZ")
-            commit_date = commit_date.replace(tzinfo=timezone.utc)
-
-            if (not start_date or commit_date >= datetime.strptime(start_date, "%Y-%m-%d").replace(
-                    tzinfo=timezone.utc)) and \
-                    (not end_date or commit_date <= datetime.strptime(end_date, "%Y-%m-%d").replace(hour=23, minute=59,
-                                                                                                    second=59,
-                                                                                                    tzinfo=timezone.utc)) and \
-                    (not username or commit['author']['login'] == username):
+        for page_commits in self._iter_pages("commits", params, List[CommitRecord], limit):
+            for commit in page_commits:
                 commit_history[commit['sha']] = {
                     "author": commit['commit']['author']['name'],
                     "username": commit['author']['login'] if commit['author'] else None,
                     "date": commit['commit']['author']['date'],
                     "message": commit['commit']['message']
                 }
+                if limit and len(commit_history) >= limit:
+                    return commit_history
 
         return commit_history
 
@@ -219,7 +599,7 @@ class GitHubIntegration:
         :param end_date: End date for issue range (inclusive), in 'YYYY-MM-DD' format
         :param username: GitHub username to filter issues (optional)
         :param limit: Maximum number of issues to retrieve (default is None, which retrieves all in range)
-        :return: Dictionary of issues
+        :return: Dictionary of GitHubItem records of the issues, keyed by number
         """
         return self._process_items("issues", start_date, end_date, username, limit)
 
@@ -230,7 +610,7 @@ class GitHubIntegration:
         :param end_date: End date for PR range (inclusive), in 'YYYY-MM-DD' format
         :param username: GitHub username to filter PRs (optional)
         :param limit: Maximum number of PRs to retrieve (default is None, which retrieves all in range)
-        :return: Dictionary of pull requests
+        :return: Dictionary of GitHubItem records of the pull requests, keyed by number
         """
         return self._process_items("pulls", start_date, end_date, username, limit)
 
@@ -240,7 +620,11 @@ class GitHubIntegration:
         :param pr_number: The number of the pull request
         :return: List of commits in the pull request
         """
-        return self._make_request(f"pulls/{pr_number}/commits")
+        return [
+            commit
+            for page_commits in self._iter_pages(f"pulls/{pr_number}/commits", {"per_page": 100})
+            for commit in page_commits
+        ]
 
     def get_pull_request_diff(self, pr_number):
         """
@@ -276,59 +660,142 @@ class GitHubIntegration:
             for release in self._make_request("releases", params={"per_page": limit})
         ]
 
-    def get_user_activity(self, username, start_date=None, end_date=None):
+    def _get_user_activity_graphql(self, username, start_dt, end_dt):
         """
-        Aggregate information about a user's activity within a specific time period.
+        Collect a user's commits, pull requests and issues with a single GraphQL query.
         :param username: GitHub username to analyze
-        :param start_date: Start date for the analysis period, in 'YYYY-MM-DD' format
-        :param end_date: End date for the analysis period, in 'YYYY-MM-DD' format
-        :return: Dictionary containing aggregated user activity information, if the
-        start and end dates are not provided, the default period is the last 7 days.
+        :param start_dt: Start of the analysis period, as a UTC datetime
+        :param end_dt: End of the analysis period, as a UTC datetime
+        :return: A tuple of the commit messages, the pull request details and the issue details
         """
-        if end_date is None:
-            end_datetime = datetime.now(timezone.utc).replace(hour=23, minute=59, second=59, microsecond=0)
-            end_date = end_datetime.strftime("%Y-%m-%d")
-        else:
-            end_datetime = (datetime.strptime(end_date, "%Y-%m-%d")
-                            .replace(hour=23, minute=59, second=59, zinfo=timezone.utc))
-
-        if start_date is None:
-            start_datetime = end_datetime - timedelta(days=6)
-            start_date = start_datetime.strftime("%Y-%m-%d")
-        else:
-            start_datetime = datetime.strptime(start_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        if username not in self._user_ids:
+            user = self._graphql("query($login: String!) { user(login: $login) { id } }", {"login": username})
+            if user["user"] is None:
+                raise RuntimeError(f"GitHub user {username} not found")
+            self._user_ids[username] = user["user"]["id"]
+
+        owner, name = self.github_repo.split("/")
+        # Sort the search results like the REST listings, newest first.
+        search_query = f"repo:{self.github_repo} author:{username} sort:created-desc " \
+                       f"created:{start_dt.strftime('%Y-%m-%d')}..{end_dt.strftime('%Y-%m-%d')}"
+        data = self._graphql(USER_ACTIVITY_QUERY, {
+            "owner": owner,
+            "name": name,
+            "authorId": self._user_ids[username],
+            "since": start_dt.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "until": end_dt.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "prQuery": f"{search_query} is:pr",
+            "issueQuery": f"{search_query} is:issue",
+        })
+
+        repository = data["repository"]
+        if repository is None or repository["defaultBranchRef"] is None:
+            raise RuntimeError(f"Repository {self.github_repo} not found or has no default branch")
+        history = repository["defaultBranchRef"]["target"]["history"]
+        pull_requests = data["pullRequests"]["nodes"]
+        if history["pageInfo"]["hasNextPage"] or data["pullRequests"]["pageInfo"]["hasNextPage"] \
+                or data["issues"]["pageInfo"]["hasNextPage"] \
+                or any(pr["commits"]["totalCount"] > len(pr["commits"]["nodes"]) for pr in pull_requests):
+            raise RuntimeError("User activity exceeds a single GraphQL page")
+
+        commit_messages = [commit['message'] for commit in history["nodes"]]
+        pr_details = [{
+            'number': pr['number'],
+            'title': pr['title'],
+            'description': pr['body'],
+            # Match the REST states, where merged pull requests are reported as closed
+            'status': 'open' if pr['state'] == 'OPEN' else 'closed',
+            'commit_count': pr['commits']['totalCount'],
+            'commit_messages': [node['commit']['message'] for node in pr['commits']['nodes']]
+        } for pr in pull_requests]
+        issue_details = [{
+            'number': issue['number'],
+            'title': issue['title'],
+            'description': issue['body']
+        } for issue in data["issues"]["nodes"]]
+        return commit_messages, pr_details, issue_details
 
-        # Fetch data
-        commits = self.get_commit_history(start_date, end_date, username)
-        pull_requests = self.get_pull_requests(start_date, end_date, username)
-        issues = self.get_issues(start_date, end_date, username)
+    def _get_user_activity_rest(self, username, start_dt, end_dt):
+        """
+        Collect a user's commits, pull requests and issues with the paginated REST endpoints.
+        :param username: GitHub username to analyze
+        :param start_dt: Start of the analysis period, as a UTC datetime
+        :param end_dt: End of the analysis period, as a UTC datetime
+        :return: A tuple of the commit messages, the pull request details and the issue details
+        """
+        # The three listings are independent, and the per-PR commit requests only wait on the PR listing.
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            commits_future = executor.submit(
+                self.get_commit_history, username=username, start_dt=start_dt, end_dt=end_dt
+            )
+            issues_future = executor.submit(
+                self._process_items, "issues", username=username, start_dt=start_dt, end_dt=end_dt
+            )
+            pull_requests = self._process_items("pulls", username=username, start_dt=start_dt, end_dt=end_dt)
+            all_pr_commits = list(executor.map(
+                lambda pr: self.get_pull_request_commits(pr.number), pull_requests.values()
+            ))
+            commits = commits_future.result()
+            issues = issues_future.result()
 
         # Aggregate commit information
-        commit_count = len(commits)
         commit_messages = [commit['message'] for commit in commits.values()]
 
         # Aggregate pull request information
-        pr_count = len(pull_requests)
         pr_details = []
-        for pr in pull_requests.values():
-            pr_commits = self.get_pull_request_commits(pr['number'])
+        for pr, pr_commits in zip(pull_requests.values(), all_pr_commits):
             pr_details.append({
-                'number': pr['number'],
-                'title': pr['title'],
-                'description': pr['body'],
-                'status': pr['state'],
+                'number': pr.number,
+                'title': pr.title,
+                'description': pr.body,
+                'status': pr.state,
                 'commit_count': len(pr_commits),
                 'commit_messages': [commit['commit']['message'] for commit in pr_commits]
             })
 
         # Aggregate issue information
-        issue_count = len(issues)
         issue_details = [{
-            'number': issue['number'],
-            'title': issue['title'],
-            'description': issue['body']
+            'number': issue.number,
+            'title': issue.title,
+            'description': issue.body
         } for issue in issues.values()]
 
+        return commit_messages, pr_details, issue_details
+
+    def get_user_activity(self, username, start_date=None, end_date=None):
+        """
+        Aggregate information about a user's activity within a specific time period.
+        :param username: GitHub username to analyze
+        :param start_date: Start date for the analysis period, in 'YYYY-MM-DD' format
+        :param end_date: End date for the analysis period, in 'YYYY-MM-DD' format
+        :return: Dictionary containing aggregated user activity information, if the
+        start and end dates are not provided, the default period is the last 7 days.
+        """
+        if end_date is None:
+            end_datetime = datetime.now(timezone.utc).replace(hour=23, minute=59, second=59, microsecond=0)
+            end_date = end_datetime.strftime("%Y-%m-%d")
+        else:
+            _, end_datetime = self._parse_date_range(end_date=end_date)
+
+        if start_date is None:
+            start_datetime = (end_datetime - timedelta(days=6)).replace(hour=0, minute=0, second=0)
+            start_date = start_datetime.strftime("%Y-%m-%d")
+        else:
+            start_datetime, _ = self._parse_date_range(start_date=start_date)
+
+        try:
+            commit_messages, pr_details, issue_details = self._get_user_activity_graphql(
+                username, start_datetime, end_datetime
+            )
+        except (requests.exceptions.RequestException, RuntimeError):
+            # The token may lack the GraphQL scopes, or the period has more than one page of results.
+            commit_messages, pr_details, issue_details = self._get_user_activity_rest(
+                username, start_datetime, end_datetime
+            )
+        commit_count = len(commit_messages)
+        pr_count = len(pr_details)
+        issue_count = len(issue_details)
+
         # Compile the report
         report = {
             'username': username,
@@ -44,6 +44,9 @@ setup(
     zip_safe=False,
     include_package_data=True,
     install_requires=requirements,
+    extras_require={
+        "fast-json": ["orjson", "msgspec"],
+    },
     setup_requires=['setuptools>=38.6.0'],
     classifiers=[
         'Development Status :: 5 - Production/Stable',